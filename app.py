@@ -24,6 +24,7 @@ API Endpoints:
     - /register: User registration
     - /login: User authentication
     - /template: Template management
+    - /template/batch: Bulk template creation
     - /task: Task management
     - /team: Team member listing
 
@@ -33,394 +34,513 @@ Requirements:
     - Flask-JWT-Extended
     - Python-dotenv
     - Werkzeug
+    - argon2-cffi
+    - cachetools
     - Flask-CORS
+    - orjson
 
 Environment Variables Required:
     - JWT_SECRET_KEY
     - MONGO_URI
+
+Optional Environment Variables:
+    - SERVE_STATIC: set to 0 when nginx serves the React build (see deploy/nginx.conf)
+
+Deployment:
+    `gunicorn app:app` loads gunicorn.conf.py: gthread workers (WEB_CONCURRENCY, default 2)
+    with GUNICORN_THREADS threads each (default 8). Each worker process opens its own
+    MongoDB connection pool (maxPoolSize=20), so keep threads <= 20 and workers * 20 below
+    the Atlas cluster's connection limit. Do not use --preload: MongoClient is not
+    fork-safe and must be created in each worker.
 """
 
 
 
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, request, send_from_directory
+from flask.json.provider import JSONProvider
 from flask_jwt_extended import JWTManager, create_access_token, get_jwt_identity, jwt_required
-from pymongo import MongoClient
+from pymongo import MongoClient, ReturnDocument, InsertOne
+from pymongo.errors import DuplicateKeyError
 from bson import ObjectId
+from bson.errors import InvalidId
+from bson.codec_options import CodecOptions, TypeDecoder, TypeRegistry
 from datetime import timedelta, datetime
+from functools import lru_cache
 import os
+import threading
+from cachetools import TTLCache
 from dotenv import load_dotenv
-from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.security import check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHash, VerifyMismatchError
 from flask_cors import CORS
+from werkzeug.exceptions import HTTPException
+import orjson
+
+
+def _orjson_default(obj):
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(obj):
+    return orjson.dumps(obj, default=_orjson_default, option=orjson.OPT_NAIVE_UTC)
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson; encodes datetime and ObjectId natively."""
+
+    def dumps(self, obj, **kwargs):
+        return dumps_json(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_json(obj), mimetype='application/json')
+
+
+def respond(body, status=200):
+    """Build a JSON response straight from orjson bytes, skipping jsonify's provider dispatch."""
+    return app.response_class(dumps_json(body), status=status, mimetype='application/json')
+
+
+class ObjectIdAsString(TypeDecoder):
+    """Decode ObjectId values as hex strings inside the BSON decoder."""
+
+    bson_type = ObjectId
+
+    def transform_bson(self, value):
+        return str(value)
+
 
 load_dotenv()
 app = Flask(__name__, static_folder='template-management/build')
+app.json = OrjsonProvider(app)
 CORS(app)
 
 app.config['JWT_SECRET_KEY'] = os.getenv('JWT_SECRET_KEY')
 app.config['JWT_ACCESS_TOKEN_EXPIRES'] = timedelta(days=1)
 jwt = JWTManager(app)
 
+ph = PasswordHasher(time_cost=3, memory_cost=65536, parallelism=2)
+
+REGISTER_FIELDS = frozenset(('first_name', 'last_name', 'email', 'password'))
+LOGIN_FIELDS = frozenset(('email', 'password'))
+TEMPLATE_FIELDS = frozenset(('template_name', 'subject', 'body'))
+TASK_FIELDS = frozenset(('assigned_user', 'task_date', 'task_time', 'task_msg'))
+TASK_UPDATE_FIELDS = frozenset(('is_completed',))
+
 
 MONGO_URI = os.getenv('MONGO_URI')
 try:
-    client = MongoClient(MONGO_URI)
+    client = MongoClient(
+        MONGO_URI,
+        maxPoolSize=20,
+        minPoolSize=2,
+        maxIdleTimeMS=30000,
+        serverSelectionTimeoutMS=3000,
+        connectTimeoutMS=3000,
+        retryWrites=True,
+        w=1,
+        compressors='zstd,zlib'
+    )
     client.admin.command('ping')
     print("Successfully connected to MongoDB!")
-    db = client['template_management']
+    db = client.get_database(
+        'template_management',
+        codec_options=CodecOptions(type_registry=TypeRegistry([ObjectIdAsString()]))
+    )
 except Exception as e:
     print(f"Failed to connect to MongoDB: {e}")
+else:
+    # register relies on the unique email index to reject duplicates, so a
+    # failure here (e.g. existing duplicate emails) must stop startup.
+    db.users.create_index('email', unique=True, background=True)
+    db.templates.create_index([('user_id', 1), ('created_at', -1)], background=True)
+    db.tasks.create_index([('assigned_user', 1), ('created_at', -1)], background=True)
+    db.tasks.create_index('assigned_by', background=True)
+
+
+user_name_cache = TTLCache(maxsize=10000, ttl=300)
+user_name_cache_lock = threading.Lock()
+
+
+def find_user_names(user_ids):
+    """Map each user id string to the user's full name, querying only cache misses with one `$in`."""
+    user_ids = set(user_ids)
+    names = {}
+    with user_name_cache_lock:
+        for user_id in user_ids:
+            name = user_name_cache.get(user_id)
+            if name is not None:
+                names[user_id] = name
+
+    missing = [user_id for user_id in user_ids if user_id not in names]
+    if missing:
+        users = db.users.find(
+            {'_id': {'$in': [ObjectId(user_id) for user_id in missing]}},
+            {'first_name': 1, 'last_name': 1}
+        )
+        fetched = {user['_id']: f"{user['first_name']} {user['last_name']}" for user in users}
+        with user_name_cache_lock:
+            user_name_cache.update(fetched)
+        names.update(fetched)
+
+    return names
+
+
+def update_user_name(user_id, first_name, last_name):
+    """Rename a user and fan the new name out to the tasks that store it denormalized."""
+    user_oid = ObjectId(user_id)
+    name = f"{first_name} {last_name}"
+    db.users.update_one({'_id': user_oid}, {'$set': {'first_name': first_name, 'last_name': last_name}})
+    db.tasks.update_many({'assigned_by': user_oid}, {'$set': {'assigned_by_name': name}})
+    db.tasks.update_many({'assigned_user': user_oid}, {'$set': {'assigned_to_name': name}})
+    with user_name_cache_lock:
+        user_name_cache.pop(str(user_oid), None)
+
+
+def verify_password(user, password):
+    """Check `password` against the user's stored hash, upgrading legacy werkzeug hashes to Argon2id.
+
+    An Argon2 mismatch raises VerifyMismatchError, which the error handler turns into a 401.
+    """
+    stored = user['password']
+    if not stored.startswith('$argon2'):
+        if not check_password_hash(stored, password):
+            return False
+        db.users.update_one({'_id': ObjectId(user['_id'])}, {'$set': {'password': ph.hash(password)}})
+        return True
+
+    try:
+        ph.verify(stored, password)
+    except InvalidHash:
+        return False
+
+    if ph.check_needs_rehash(stored):
+        db.users.update_one({'_id': ObjectId(user['_id'])}, {'$set': {'password': ph.hash(password)}})
+    return True
 
 
 @app.route('/')
 def home():
-    return jsonify({'message': 'Welcome to Template Management API'}), 200
+    return respond({'message': 'Welcome to Template Management API'}, 200)
 
 
 @app.errorhandler(Exception)
 def handle_invalid_usage(error):
-    if "Invalid ObjectId" in str(error):
-        return jsonify({"message": "Invalid template ID format"}), 400
-    return jsonify({"message": str(error)}), 500
+    if isinstance(error, HTTPException):
+        return respond({"message": error.description}, error.code)
+    if isinstance(error, InvalidId):
+        return respond({"message": "Invalid ID format"}, 400)
+    if isinstance(error, DuplicateKeyError):
+        return respond({"message": "Resource already exists"}, 409)
+    if isinstance(error, VerifyMismatchError):
+        return respond({"message": "Invalid credentials"}, 401)
+    app.logger.exception(error)
+    return respond({"message": "Internal server error"}, 500)
 
 
 @app.route('/register', methods=['POST'])
 def register():
-    try:
-        data = request.get_json()
-        if not data:
-            return jsonify({'message': 'No input data provided'}), 400
-
-        required_fields = ['first_name', 'last_name', 'email', 'password']
+    data = request.get_json(silent=True, cache=False)
+    if not data:
+        return respond({'message': 'No input data provided'}, 400)
 
-        
-        if not all(field in data for field in required_fields):
-            return jsonify({'message': 'Missing required fields'}), 400
+    if not REGISTER_FIELDS.issubset(data):
+        return respond({'message': 'Missing required fields'}, 400)
 
-       
-        if db.users.find_one({'email': data['email']}):
-            return jsonify({'message': 'Email already registered'}), 400
-
-        user = {
-            'first_name': data['first_name'],
-            'last_name': data['last_name'],
-            'email': data['email'],
-            'password': generate_password_hash(data['password']),
-            'created_at': datetime.utcnow()
-        }
+    user = {
+        'first_name': data['first_name'],
+        'last_name': data['last_name'],
+        'email': data['email'],
+        'password': ph.hash(data['password']),
+        'created_at': datetime.utcnow()
+    }
 
+    try:
         db.users.insert_one(user)
-        return jsonify({'message': 'User registered successfully'}), 201
-    except Exception as e:
-        return jsonify({'message': str(e)}), 500
+    except DuplicateKeyError:
+        return respond({'message': 'Email already registered'}, 409)
+
+    return respond({'message': 'User registered successfully'}, 201)
 
 
 @app.route('/login', methods=['POST'])
 def login():
-    try:
-        data = request.get_json()
-        if not data:
-            return jsonify({'message': 'No input data provided'}), 400
+    data = request.get_json(silent=True, cache=False)
+    if not data:
+        return respond({'message': 'No input data provided'}, 400)
 
-       
-        if not all(field in data for field in ['email', 'password']):
-            return jsonify({'message': 'Missing email or password'}), 400
+   
+    if not LOGIN_FIELDS.issubset(data):
+        return respond({'message': 'Missing email or password'}, 400)
 
-        user = db.users.find_one({'email': data['email']})
+    user = db.users.find_one({'email': data['email']})
 
-        if user and check_password_hash(user['password'], data['password']):
-            access_token = create_access_token(identity=str(user['_id']))
-            return jsonify({
-                'message': 'Login successful',
-                'access_token': access_token
-            }), 200
+    if user and verify_password(user, data['password']):
+        access_token = create_access_token(identity=user['_id'])
+        return respond({
+            'message': 'Login successful',
+            'access_token': access_token
+        }, 200)
 
-        return jsonify({'message': 'Invalid credentials'}), 401
-    except Exception as e:
-        return jsonify({'message': str(e)}), 500
+    return respond({'message': 'Invalid credentials'}, 401)
 
 
 @app.route('/template', methods=['POST'])
 @jwt_required()
 def create_template():
-    try:
-        current_user = get_jwt_identity()
-        data = request.get_json()
-        if not data:
-            return jsonify({'message': 'No input data provided'}), 400
-
-        
-        required_fields = ['template_name', 'subject', 'body']
-        if not all(field in data for field in required_fields):
-            return jsonify({'message': 'Missing required fields'}), 400
-
-        template = {
-            'user_id': current_user,
-            'template_name': data['template_name'],
-            'subject': data['subject'],
-            'body': data['body'],
-            'created_at': datetime.utcnow()
-        }
-
-        result = db.templates.insert_one(template)
-        return jsonify({
-            'message': 'Template created',
-            'id': str(result.inserted_id)
-        }), 201
-    except Exception as e:
-        return jsonify({'message': str(e)}), 500
+    current_user = ObjectId(get_jwt_identity())
+    data = request.get_json(silent=True, cache=False)
+    if not data:
+        return respond({'message': 'No input data provided'}, 400)
+
+    
+    if not TEMPLATE_FIELDS.issubset(data):
+        return respond({'message': 'Missing required fields'}, 400)
+
+    template = {
+        'user_id': current_user,
+        'template_name': data['template_name'],
+        'subject': data['subject'],
+        'body': data['body'],
+        'created_at': datetime.utcnow()
+    }
+
+    result = db.templates.insert_one(template)
+    return respond({
+        'message': 'Template created',
+        'id': str(result.inserted_id)
+    }, 201)
+
+@app.route('/template/batch', methods=['POST'])
+@jwt_required()
+def create_templates_batch():
+    current_user = ObjectId(get_jwt_identity())
+    data = request.get_json(silent=True, cache=False)
+    if not data or not isinstance(data, list):
+        return respond({'message': 'Expected a non-empty list of templates'}, 400)
+
+    if not all(isinstance(item, dict) and TEMPLATE_FIELDS.issubset(item) for item in data):
+        return respond({'message': 'Missing required fields'}, 400)
+
+    now = datetime.utcnow()
+    templates = [{
+        '_id': ObjectId(),
+        'user_id': current_user,
+        'template_name': item['template_name'],
+        'subject': item['subject'],
+        'body': item['body'],
+        'created_at': now
+    } for item in data]
+
+    db.templates.bulk_write([InsertOne(template) for template in templates], ordered=False)
+    return respond({
+        'message': 'Templates created',
+        'ids': [str(template['_id']) for template in templates]
+    }, 201)
 
 @app.route('/template', methods=['GET'])
 @jwt_required()
 def get_all_templates():
-    try:
-        current_user = get_jwt_identity()
-        templates = list(db.templates.find({'user_id': current_user}))
-
-      
-        for template in templates:
-            template['_id'] = str(template['_id'])
-           
-            if 'created_at' in template:
-                template['created_at'] = template['created_at'].isoformat()
-            if 'updated_at' in template:
-                template['updated_at'] = template['updated_at'].isoformat()
-
-        return jsonify(templates), 200
-    except Exception as e:
-        return jsonify({'message': str(e)}), 500
+    current_user = ObjectId(get_jwt_identity())
+    templates = list(db.templates.find({'user_id': current_user}).batch_size(500))
+    return respond(templates, 200)
 
 @app.route('/template/<template_id>', methods=['GET', 'PUT', 'DELETE'])
 @jwt_required()
 def template_operations(template_id):
-    try:
-        current_user = get_jwt_identity()
+    current_user = ObjectId(get_jwt_identity())
 
-        
-        try:
-            template_obj_id = ObjectId(template_id)
-        except:
-            return jsonify({'message': 'Invalid template ID format'}), 400
+    template_obj_id = ObjectId(template_id)
 
-        if request.method == 'GET':
-            template = db.templates.find_one({
-                '_id': template_obj_id,
-                'user_id': current_user
-            })
+    if request.method == 'GET':
+        template = db.templates.find_one({
+            '_id': template_obj_id,
+            'user_id': current_user
+        })
 
-            if not template:
-                return jsonify({'message': 'Template not found'}), 404
+        if not template:
+            return respond({'message': 'Template not found'}, 404)
 
-            template['_id'] = str(template['_id'])
-            
-            if 'created_at' in template:
-                template['created_at'] = template['created_at'].isoformat()
-            if 'updated_at' in template:
-                template['updated_at'] = template['updated_at'].isoformat()
+        return respond(template, 200)
 
-            return jsonify(template), 200
+    elif request.method == 'PUT':
+        data = request.get_json(silent=True, cache=False)
+        if not data:
+            return respond({'message': 'No input data provided'}, 400)
 
-        elif request.method == 'PUT':
-            data = request.get_json()
-            if not data:
-                return jsonify({'message': 'No input data provided'}), 400
 
-   
-            required_fields = ['template_name', 'subject', 'body']
-            if not all(field in data for field in required_fields):
-                return jsonify({'message': 'Missing required fields'}), 400
+        if not TEMPLATE_FIELDS.issubset(data):
+            return respond({'message': 'Missing required fields'}, 400)
 
-            result = db.templates.update_one(
-                {'_id': template_obj_id, 'user_id': current_user},
-                {'$set': {
-                    'template_name': data['template_name'],
-                    'subject': data['subject'],
-                    'body': data['body'],
-                    'updated_at': datetime.utcnow()
-                }}
-            )
+        result = db.templates.update_one(
+            {'_id': template_obj_id, 'user_id': current_user},
+            {'$set': {
+                'template_name': data['template_name'],
+                'subject': data['subject'],
+                'body': data['body'],
+                'updated_at': datetime.utcnow()
+            }}
+        )
 
-            if result.modified_count == 0:
-                return jsonify({'message': 'Template not found'}), 404
+        if result.modified_count == 0:
+            return respond({'message': 'Template not found'}, 404)
 
-            return jsonify({'message': 'Template updated successfully'}), 200
+        return respond({'message': 'Template updated successfully'}, 200)
 
-        elif request.method == 'DELETE':
-            result = db.templates.delete_one({
-                '_id': template_obj_id,
-                'user_id': current_user
-            })
+    elif request.method == 'DELETE':
+        result = db.templates.delete_one({
+            '_id': template_obj_id,
+            'user_id': current_user
+        })
 
-            if result.deleted_count == 0:
-                return jsonify({'message': 'Template not found'}), 404
+        if result.deleted_count == 0:
+            return respond({'message': 'Template not found'}, 404)
 
-            return jsonify({'message': 'Template deleted successfully'}), 200
+        return respond({'message': 'Template deleted successfully'}, 200)
 
-    except Exception as e:
-        return jsonify({'message': str(e)}), 500
 
 
 @app.route('/task', methods=['POST'])
 @jwt_required()
 def create_task():
-    try:
-        current_user = get_jwt_identity()
-        data = request.get_json()
-        if not data:
-            return jsonify({'message': 'No input data provided'}), 400
-
-        
-        required_fields = ['assigned_user', 'task_date', 'task_time', 'task_msg']
-        if not all(field in data for field in required_fields):
-            return jsonify({'message': 'Missing required fields'}), 400
-
-        assigned_user = db.users.find_one({'_id': ObjectId(data['assigned_user'])})
-        if not assigned_user:
-            return jsonify({'message': 'Assigned user not found'}), 404
-
-        task = {
-            'assigned_by': current_user,
-            'assigned_user': data['assigned_user'],
-            'task_date': data['task_date'],
-            'task_time': data['task_time'],
-            'task_msg': data['task_msg'],
-            'is_completed': 0,
-            'created_at': datetime.utcnow()
-        }
-
-        result = db.tasks.insert_one(task)
-        return jsonify({
-            'message': 'Task created',
-            'id': str(result.inserted_id)
-        }), 201
-    except Exception as e:
-        return jsonify({'message': str(e)}), 500
+    current_user = ObjectId(get_jwt_identity())
+    data = request.get_json(silent=True, cache=False)
+    if not data:
+        return respond({'message': 'No input data provided'}, 400)
+
+    
+    if not TASK_FIELDS.issubset(data):
+        return respond({'message': 'Missing required fields'}, 400)
+
+    assigned_user_id = ObjectId(data['assigned_user'])
+    # Names are stored on the task permanently, so read them from the database
+    # rather than the per-process cache, which may hold a stale name.
+    users = db.users.find(
+        {'_id': {'$in': [assigned_user_id, current_user]}},
+        {'first_name': 1, 'last_name': 1}
+    )
+    names = {user['_id']: f"{user['first_name']} {user['last_name']}" for user in users}
+    if str(assigned_user_id) not in names:
+        return respond({'message': 'Assigned user not found'}, 404)
+
+    task = {
+        'assigned_by': current_user,
+        'assigned_user': assigned_user_id,
+        'assigned_by_name': names.get(str(current_user)),
+        'assigned_to_name': names[str(assigned_user_id)],
+        'task_date': data['task_date'],
+        'task_time': data['task_time'],
+        'task_msg': data['task_msg'],
+        'is_completed': 0,
+        'created_at': datetime.utcnow()
+    }
+
+    result = db.tasks.insert_one(task)
+    return respond({
+        'message': 'Task created',
+        'id': str(result.inserted_id)
+    }, 201)
 
 @app.route('/task', methods=['GET'])
 @jwt_required()
 def get_tasks():
-    try:
-        current_user = get_jwt_identity()
-        tasks = list(db.tasks.find({'assigned_user': current_user}))
-
-        
-        for task in tasks:
-            task['_id'] = str(task['_id'])
-            task['assigned_by'] = str(task['assigned_by'])
-            task['assigned_user'] = str(task['assigned_user'])
-            assigned_by_user = db.users.find_one({'_id': ObjectId(task['assigned_by'])})
-            assigned_to_user = db.users.find_one({'_id': ObjectId(task['assigned_user'])})
-            task['assigned_by_name'] = f"{assigned_by_user['first_name']} {assigned_by_user['last_name']}"
-            task['assigned_to_name'] = f"{assigned_to_user['first_name']} {assigned_to_user['last_name']}"
-            
-            if 'created_at' in task:
-                task['created_at'] = task['created_at'].isoformat()
-
-        return jsonify(tasks), 200
-    except Exception as e:
-        return jsonify({'message': str(e)}), 500
+    current_user = ObjectId(get_jwt_identity())
+    tasks = list(db.tasks.find({'assigned_user': current_user}).batch_size(500))
+    return respond(tasks, 200)
 
 @app.route('/task/<task_id>', methods=['GET', 'PUT', 'DELETE'])
 @jwt_required()
 def task_operations(task_id):
-    try:
-        current_user = get_jwt_identity()
-
-       
-        try:
-            task_obj_id = ObjectId(task_id)
-        except:
-            return jsonify({'message': 'Invalid task ID format'}), 400
-
-        if request.method == 'GET':
-            task = db.tasks.find_one({
-                '_id': task_obj_id,
-                'assigned_user': current_user
-            })
-
-            if not task:
-                return jsonify({'message': 'Task not found'}), 404
-
-            task['_id'] = str(task['_id'])
-            task['assigned_by'] = str(task['assigned_by'])
-            task['assigned_user'] = str(task['assigned_user'])
-            assigned_by_user = db.users.find_one({'_id': ObjectId(task['assigned_by'])})
-            assigned_to_user = db.users.find_one({'_id': ObjectId(task['assigned_user'])})
-            task['assigned_by_name'] = f"{assigned_by_user['first_name']} {assigned_by_user['last_name']}"
-            task['assigned_to_name'] = f"{assigned_to_user['first_name']} {assigned_to_user['last_name']}"
-            
-            if 'created_at' in task:
-                task['created_at'] = task['created_at'].isoformat()
-
-            return jsonify(task), 200
-
-        elif request.method == 'PUT':
-            data = request.get_json()
-            if not data:
-                return jsonify({'message': 'No input data provided'}), 400
-
-          
-            required_fields = ['is_completed']
-            if not all(field in data for field in required_fields):
-                return jsonify({'message': 'Missing required fields'}), 400
-
-            task = db.tasks.find_one({'_id': task_obj_id, 'assigned_user': current_user})
-            if not task:
-                return jsonify({'message': 'Task not found'}), 404
-
-            result = db.tasks.update_one(
-                {'_id': task_obj_id, 'assigned_user': current_user},
-                {'$set': {
-                    'is_completed': data['is_completed'],
-                    'updated_at': datetime.utcnow()
-                }}
-            )
-
-            if result.modified_count == 0:
-                return jsonify({'message': 'Task not found'}), 404
-
-            assigned_by_user = db.users.find_one({'_id': ObjectId(task['assigned_by'])})
-            assigned_to_user = db.users.find_one({'_id': ObjectId(task['assigned_user'])})
-            notification_message = f"Task completed by {assigned_to_user['first_name']} {assigned_to_user['last_name']}"
-            return jsonify({'message': 'Task updated successfully', 'notification': notification_message}), 200
-
-        elif request.method == 'DELETE':
-            task = db.tasks.find_one({'_id': task_obj_id, 'assigned_user': current_user})
-            if not task:
-                return jsonify({'message': 'Task not found'}), 404
-
-            result = db.tasks.delete_one({
-                '_id': task_obj_id,
-                'assigned_user': current_user
-            })
-
-            if result.deleted_count == 0:
-                return jsonify({'message': 'Task not found'}), 404
-
-            return jsonify({'message': 'Task deleted successfully'}), 200
-
-    except Exception as e:
-        return jsonify({'message': str(e)}), 500
+    current_user = ObjectId(get_jwt_identity())
+
+    task_obj_id = ObjectId(task_id)
+
+    if request.method == 'GET':
+        task = db.tasks.find_one({
+            '_id': task_obj_id,
+            'assigned_user': current_user
+        })
+
+        if not task:
+            return respond({'message': 'Task not found'}, 404)
+
+        return respond(task, 200)
+
+    elif request.method == 'PUT':
+        data = request.get_json(silent=True, cache=False)
+        if not data:
+            return respond({'message': 'No input data provided'}, 400)
+
+      
+        if not TASK_UPDATE_FIELDS.issubset(data):
+            return respond({'message': 'Missing required fields'}, 400)
+
+        task = db.tasks.find_one_and_update(
+            {'_id': task_obj_id, 'assigned_user': current_user},
+            {'$set': {
+                'is_completed': data['is_completed'],
+                'updated_at': datetime.utcnow()
+            }},
+            projection={'assigned_to_name': 1},
+            return_document=ReturnDocument.AFTER
+        )
+
+        if not task:
+            return respond({'message': 'Task not found'}, 404)
+
+        # Tasks created before the name was denormalized may lack it
+        assigned_to_name = task.get('assigned_to_name')
+        if not assigned_to_name:
+            user_id = str(current_user)
+            assigned_to_name = find_user_names([user_id]).get(user_id, 'Unknown user')
+
+        notification_message = f"Task completed by {assigned_to_name}"
+        return respond({'message': 'Task updated successfully', 'notification': notification_message}, 200)
+
+    elif request.method == 'DELETE':
+        task = db.tasks.find_one_and_delete(
+            {'_id': task_obj_id, 'assigned_user': current_user},
+            projection={'_id': 1}
+        )
+
+        if not task:
+            return respond({'message': 'Task not found'}, 404)
+
+        return respond({'message': 'Task deleted successfully'}, 200)
+
 
 
 @app.route('/team', methods=['GET'])
 @jwt_required()
 def get_users():
-    try:
-        current_user = get_jwt_identity()
-        users = list(db.users.find({'_id': {'$ne': ObjectId(current_user)}}))
-        for user in users:
-            user['_id'] = str(user['_id'])
-        return jsonify(users), 200
-    except Exception as e:
-        return jsonify({'message': str(e)}), 500
-
-@app.route('/', defaults={'path': ''})
-@app.route('/<path:path>')
-def serve(path):
-    if path != "" and os.path.exists(app.static_folder + '/' + path):
-        return send_from_directory(app.static_folder, path)
-    else:
-        return send_from_directory(app.static_folder, 'index.html')
+    current_user = ObjectId(get_jwt_identity())
+    users = list(db.users.find({'_id': {'$ne': current_user}}, {'password': 0}))
+    return respond(users, 200)
+
+@lru_cache(maxsize=1024)
+def static_file_exists(path):
+    return os.path.isfile(os.path.join(app.static_folder, path))
+
+
+if os.getenv('SERVE_STATIC', '1') == '1':
+    @app.route('/', defaults={'path': ''})
+    @app.route('/<path:path>')
+    def serve(path):
+        if path != "" and static_file_exists(path):
+            response = send_from_directory(app.static_folder, path)
+            if path.startswith('static/'):
+                response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+            return response
+
+        response = send_from_directory(app.static_folder, 'index.html')
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=os.getenv('PORT', 5000))
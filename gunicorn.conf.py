@@ -0,0 +1,14 @@
+"""
+Gunicorn settings, picked up automatically by `gunicorn app:app`.
+
+Threaded workers keep serving other requests while one thread is busy
+hashing a password; the GIL is released inside argon2 and socket I/O.
+Threads per worker must stay at or below the MongoClient maxPoolSize (20).
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+worker_class = 'gthread'
+workers = int(os.getenv('WEB_CONCURRENCY', '2'))
+threads = int(os.getenv('GUNICORN_THREADS', '8'))
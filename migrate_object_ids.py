@@ -0,0 +1,66 @@
+"""
+ ObjectId Migration
+--------------------
+
+Description:
+    One-off migration that converts user references stored as hex strings
+    (templates.user_id, tasks.assigned_by, tasks.assigned_user) into native
+    ObjectIds, matching what app.py now writes, then backfills the
+    denormalized assigned_by_name/assigned_to_name on tasks created before
+    they were stored.
+    Documents that are already up to date are left untouched, so the script
+    is safe to re-run.
+
+Usage:
+    python migrate_object_ids.py
+
+Environment Variables Required:
+    - MONGO_URI
+"""
+
+import os
+from dotenv import load_dotenv
+from pymongo import MongoClient
+
+FIELDS = {
+    'templates': ['user_id'],
+    'tasks': ['assigned_by', 'assigned_user'],
+}
+
+
+def migrate(db):
+    for collection, fields in FIELDS.items():
+        for field in fields:
+            result = db[collection].update_many(
+                {field: {'$type': 'string'}},
+                [{'$set': {field: {'$toObjectId': f'${field}'}}}]
+            )
+            print(f"{collection}.{field}: converted {result.modified_count} documents")
+
+
+NAME_FIELDS = {
+    'assigned_by': 'assigned_by_name',
+    'assigned_user': 'assigned_to_name',
+}
+
+
+def backfill_task_names(db):
+    modified = dict.fromkeys(NAME_FIELDS.values(), 0)
+    for user in db.users.find({}, {'first_name': 1, 'last_name': 1}):
+        name = f"{user['first_name']} {user['last_name']}"
+        for id_field, name_field in NAME_FIELDS.items():
+            result = db.tasks.update_many(
+                {id_field: user['_id'], name_field: {'$exists': False}},
+                {'$set': {name_field: name}}
+            )
+            modified[name_field] += result.modified_count
+    for name_field, count in modified.items():
+        print(f"tasks.{name_field}: backfilled {count} documents")
+
+
+if __name__ == '__main__':
+    load_dotenv()
+    client = MongoClient(os.getenv('MONGO_URI'))
+    db = client['template_management']
+    migrate(db)
+    backfill_task_names(db)